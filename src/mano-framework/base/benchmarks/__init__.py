@@ -0,0 +1,4 @@
+"""
+Micro benchmarks for the MANO framework base. Run them from the `base` directory, e.g.
+``python -m benchmarks.publish``.
+"""
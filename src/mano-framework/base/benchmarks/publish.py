@@ -0,0 +1,60 @@
+"""
+Measures the publishing throughput of `ManoBrokerConnection.publish()` compared to
+publishing with a fresh channel and exchange declaration per message (the behavior
+prior to channel pooling).
+
+Usage: ``python -m benchmarks.publish [--url amqp://...] [--messages N]``
+"""
+
+import argparse
+import json
+import time
+
+from .standin import make_connection
+
+
+def publish_unpooled(connection, topic, payload):
+    # Publish the way `ManoBrokerConnection.publish()` did before channel pooling
+    with connection._connection.channel() as channel:
+        channel.exchange.declare(connection.rabbitmq_exchange, exchange_type="topic")
+        channel.basic.publish(
+            body=json.dumps(payload),
+            routing_key=topic,
+            exchange=connection.rabbitmq_exchange,
+            properties={"app_id": connection.app_id},
+        )
+
+
+def measure(publish, count: int) -> float:
+    """
+    Calls `publish` `count` times and returns the number of messages per second
+    """
+    start = time.perf_counter()
+    for i in range(count):
+        publish("benchmark.publish", {"index": i})
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="AMQP URL (defaults to an in-process stand-in)")
+    parser.add_argument("--messages", type=int, default=2000)
+    args = parser.parse_args()
+
+    connection = make_connection(args.url)
+    try:
+        before = measure(
+            lambda topic, payload: publish_unpooled(connection, topic, payload),
+            args.messages,
+        )
+        after = measure(connection.publish, args.messages)
+    finally:
+        connection.close()
+
+    print("Fresh channel per message: {:10.0f} msgs/s".format(before))
+    print("Pooled channels:           {:10.0f} msgs/s".format(after))
+    print("Speedup:                   {:10.1f}x".format(after / before))
+
+
+if __name__ == "__main__":
+    main()
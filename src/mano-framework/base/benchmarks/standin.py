@@ -0,0 +1,86 @@
+"""
+A minimal in-process stand-in for an AMQPStorm broker connection. Every synchronous
+AMQP method (channel open/close, declarations, ...) blocks for a configurable round
+trip time, while `basic.publish` is asynchronous, just as with a real broker.
+"""
+
+import time
+from queue import LifoQueue
+
+from manobase.messaging import ManoBrokerConnection
+
+
+class _Namespace:
+    def __init__(self, **methods):
+        self.__dict__.update(methods)
+
+
+class StandinChannel:
+    def __init__(self, connection: "StandinConnection"):
+        self._connection = connection
+        self.is_open = True
+        self.published_count = 0
+        self._round_trip()  # channel.open
+
+        self.exchange = _Namespace(declare=self._rpc)
+        self.queue = _Namespace(declare=self._rpc, bind=self._rpc, delete=self._rpc)
+        self.basic = _Namespace(publish=self._publish, qos=self._rpc)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _round_trip(self):
+        self._connection.round_trips += 1
+        time.sleep(self._connection.rtt)
+
+    def _rpc(self, *args, **kwargs):
+        self._round_trip()
+
+    def _publish(self, *args, **kwargs):
+        self.published_count += 1
+
+    def close(self):
+        if self.is_open:
+            self._round_trip()
+            self.is_open = False
+
+
+class StandinConnection:
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.round_trips = 0
+        self.is_open = True
+        self.is_opening = False
+
+    def channel(self):
+        return StandinChannel(self)
+
+    def close(self):
+        self.is_open = False
+
+
+class StandinBrokerConnection(ManoBrokerConnection):
+    """
+    A `ManoBrokerConnection` that talks to a `StandinConnection` instead of a broker
+    """
+
+    rtt = 0.0002  # seconds
+
+    def connect(self):
+        self._channel_pool = LifoQueue()
+        self._is_exchange_declared = False
+        self._connection = StandinConnection(self.rtt)
+        return self._connection
+
+
+def make_connection(url: str = None, **kwargs) -> ManoBrokerConnection:
+    """
+    Returns a `ManoBrokerConnection` to the broker at `url`, or a connection to a
+    stand-in broker if `url` is None.
+    """
+    if url is None:
+        return StandinBrokerConnection("benchmark", **kwargs)
+    return ManoBrokerConnection("benchmark", url=url, **kwargs)
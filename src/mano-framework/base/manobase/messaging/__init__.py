@@ -1,5 +1,6 @@
 from .asyncio import AsyncioBrokerConnection
 from .base import ManoBrokerConnection, Message
+from .dispatch import BoundedExecutor
 from .request_response import ManoBrokerRequestResponseConnection
 
 __all__ = [
@@ -7,4 +8,5 @@ __all__ = [
     "AsyncioBrokerConnection",
     "ManoBrokerRequestResponseConnection",
     "Message",
+    "BoundedExecutor",
 ]
@@ -113,7 +113,9 @@ class AsyncioBrokerConnection(ManoBrokerRequestResponseConnection):
 
         return future, callback
 
-    def subscribe(self, cbf, topic, subscription_queue=None, concurrent=True):
+    def subscribe(
+        self, cbf, topic, subscription_queue=None, concurrent=True, executor=None
+    ):
         if inspect.iscoroutinefunction(cbf):
             # No need to invoke on_message_received in a separate thread, as it only
             # schedules a task to be executed in the event loop:
@@ -124,6 +126,7 @@ class AsyncioBrokerConnection(ManoBrokerRequestResponseConnection):
             topic,
             subscription_queue=subscription_queue,
             concurrent=concurrent,
+            executor=executor,
         )
 
     def _run_endpoint_handler_coroutine(
@@ -150,11 +153,13 @@ class AsyncioBrokerConnection(ManoBrokerRequestResponseConnection):
 
         self.run_coroutine(runner())
 
-    def register_async_endpoint(self, endpoint_handler, topic):
+    def register_async_endpoint(self, endpoint_handler, topic, executor=None):
         if not inspect.iscoroutinefunction(endpoint_handler):
-            return super().register_async_endpoint(endpoint_handler, topic)
+            return super().register_async_endpoint(
+                endpoint_handler, topic, executor=executor
+            )
 
-        self.subscribe(
+        return self.subscribe(
             functools.partial(
                 self._on_request_received,
                 self._run_endpoint_handler_coroutine,
@@ -165,9 +170,14 @@ class AsyncioBrokerConnection(ManoBrokerRequestResponseConnection):
             concurrent=False,
         )
 
-    def register_notification_endpoint(self, endpoint_handler, topic, key="default"):
+    def register_notification_endpoint(
+        self, endpoint_handler, topic, key="default", executor=None
+    ):
         return super().register_notification_endpoint(
-            self._replace_coroutine_with_runner(endpoint_handler), topic, key=key
+            self._replace_coroutine_with_runner(endpoint_handler),
+            topic,
+            key=key,
+            executor=executor,
         )
 
     def call_async(
@@ -29,17 +29,21 @@ partner consortium (www.sonata-nfv.eu).
 import json
 import logging
 from collections import defaultdict
+from concurrent.futures import Future
+from contextlib import contextmanager
 from copy import deepcopy
-from queue import Queue
-from threading import Event, Lock, Thread
-from typing import Any, Callable, Dict, Set
+from queue import Empty, LifoQueue, Queue
+from threading import Event, Lock, Thread, current_thread
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 from uuid import uuid4
 
 import amqpstorm
 import yaml
-from amqpstorm.exception import AMQPConnectionError
+from amqpstorm.exception import AMQPConnectionError, AMQPError
 from appcfg import get_config
 
+from .dispatch import BoundedExecutor
+
 amqp_config = get_config(__name__)["amqp"]
 
 logging.getLogger("amqpstorm.channel").setLevel(logging.ERROR)
@@ -77,14 +81,20 @@ def _publish_to_loopback_queues(topic: str, message: "Message"):
             queue.put(deepcopy(message))
 
 
-def _get_loopback_queue(topic: str, tag: str):
+def _get_loopback_queue(topic: str, tag: str, queue: "Queue[Message]" = None):
+    """
+    Returns the loopback queue with the given tag, creating it if it does not exist
+    yet. If `queue` is provided, it is used as the new queue object.
+    """
     with _loopback_queue_lock:
         if tag in _loopback_queue_tags_by_topic[topic]:
-            return _loopback_queue_by_tag[_loopback_queue_tags_by_topic[topic]]
+            return _loopback_queue_by_tag[tag]
 
         # Create new queue
         _loopback_queue_tags_by_topic[topic].add(tag)
         _loopback_topic_by_tag[tag] = topic
+        if queue is not None:
+            _loopback_queue_by_tag[tag] = queue
         return _loopback_queue_by_tag[tag]
 
 
@@ -98,6 +108,20 @@ def _delete_loopback_queue(tag: str):
             _loopback_queue_tags_by_topic[topic].discard(tag)
 
 
+class _TaggedQueue:
+    """
+    A loopback queue stand-in that forwards each item to a shared queue, as a tuple
+    with the queue's tag
+    """
+
+    def __init__(self, tag: str, queue: "Queue[Tuple[str, Message]]"):
+        self._tag = tag
+        self._queue = queue
+
+    def put(self, item):
+        self._queue.put((self._tag, item))
+
+
 class Message:
     """
     Represents a message from the message broker.
@@ -172,7 +196,16 @@ class ManoBrokerConnection:
     It uses the asynchronous adapter implementation of the amqpstorm library.
     """
 
-    def __init__(self, app_id, url=None, exchange=None, is_loopback=False):
+    def __init__(
+        self,
+        app_id,
+        url=None,
+        exchange=None,
+        is_loopback=False,
+        channel_pool_size=8,
+        max_workers: int = None,
+        multiplex=False,
+    ):
         """
         Initialize broker connection.
 
@@ -183,6 +216,18 @@ class ManoBrokerConnection:
         will be made, but messages will directly be delivered to all
         `ManoBrokerConnection` objects with ``loopback=True`` within the running python
         application.
+        :param channel_pool_size: The maximum number of idle channels that are kept
+        open for publishing. If set to 0, a new channel is opened (and closed again)
+        for every published message.
+        :param max_workers: If set, callbacks of concurrent subscriptions are run by a
+        `BoundedExecutor` with `max_workers` worker threads instead of a new thread per
+        message. Note that callbacks which block until another message of the same
+        connection is handled (e.g. using `call_sync()`) may dead-lock a bounded
+        executor.
+        :param multiplex: If set to True, all subscriptions of the connection are
+        consumed by a single thread (on a single channel) instead of a thread per
+        subscription. Non-concurrent callbacks are then run by that thread, so they
+        should return quickly.
         """
         self.app_id = app_id
         self.rabbitmq_url = amqp_config["host"] if url is None else url
@@ -195,6 +240,31 @@ class ManoBrokerConnection:
         self._subscription_queue_by_tag: Dict[str, amqpstorm.queue.Queue] = {}
         self._connection: amqpstorm.UriConnection = None
 
+        # Idle publishing channels (only used by a single thread at a time)
+        self._channel_pool_size = channel_pool_size
+        self._channel_pool: "LifoQueue[amqpstorm.Channel]" = LifoQueue()
+
+        # The exchange only has to be declared once per connection
+        self._is_exchange_declared = False
+        self._exchange_declaration_lock = Lock()
+
+        self.executor: Optional[BoundedExecutor] = (
+            None
+            if max_workers is None
+            else BoundedExecutor(max_workers, name="%s.dispatch" % app_id)
+        )
+
+        # Multiplexed consumption
+        self._is_multiplexed = multiplex
+        self._consumer_thread: Thread = None
+        self._consumer_thread_lock = Lock()
+        self._consumer_channel: amqpstorm.Channel = None
+        # Commands to be run by the consumer thread, with the consumer channel
+        self._consumer_commands: "Queue[Tuple[Callable, Future]]" = Queue()
+        # Deliveries of all loopback subscriptions, with their consumer tags
+        self._loopback_inbox: "Queue[Tuple[str, Message]]" = Queue()
+        self._loopback_callback_by_tag: Dict[str, Callable[[Message], None]] = {}
+
         if not self._is_loopback:
             self.connect()
 
@@ -206,6 +276,8 @@ class ManoBrokerConnection:
         Connect to RabbitMQ using `self.rabbitmq_url`. You usually do not have to call
         this yourself, as it is already done by the constructor.
         """
+        self._channel_pool = LifoQueue()
+        self._is_exchange_declared = False
         self._connection = amqpstorm.UriConnection(self.rabbitmq_url)
         return self._connection
 
@@ -213,15 +285,172 @@ class ManoBrokerConnection:
         """
         Close the connection, stopping all consuming threads
         """
+        if self.executor is not None:
+            self.executor.shutdown()
+
         if self._is_loopback:
-            for tag in self._subscription_queue_by_tag:
+            for tag in list(self._subscription_queue_by_tag):
                 _delete_loopback_queue(tag)
+            if self._consumer_thread is not None:
+                self._loopback_inbox.put((None, "STOP"))
         else:
             if self._connection is not None and (
                 self._connection.is_open or self._connection.is_opening
             ):
+                self._close_pooled_channels()
                 self._connection.close()
 
+    def _declare_exchange(self, channel: amqpstorm.Channel):
+        """
+        Declares the connection's topic exchange using `channel`, unless it has already
+        been declared on this connection before.
+        """
+        if self._is_exchange_declared:
+            return
+
+        with self._exchange_declaration_lock:
+            if not self._is_exchange_declared:
+                channel.exchange.declare(
+                    exchange=self.rabbitmq_exchange, exchange_type="topic"
+                )
+                self._is_exchange_declared = True
+
+    @contextmanager
+    def _pooled_channel(self):
+        """
+        Context manager that provides an open channel for exclusive use by the calling
+        thread. The channel is taken from the channel pool (or newly opened if the pool
+        is empty) and returned to the pool afterwards. Channels that raised an
+        exception are closed instead of being returned.
+        """
+        channel = None
+        while channel is None:
+            try:
+                channel = self._channel_pool.get_nowait()
+                if not channel.is_open:
+                    channel = None
+            except Empty:
+                channel = self._connection.channel()
+
+        try:
+            self._declare_exchange(channel)
+            yield channel
+        except Exception:
+            self._close_channel(channel)
+            raise
+
+        if self._channel_pool.qsize() < self._channel_pool_size:
+            self._channel_pool.put(channel)
+        else:
+            self._close_channel(channel)
+
+    @staticmethod
+    def _close_channel(channel: amqpstorm.Channel):
+        try:
+            channel.close()
+        except AMQPError:
+            pass
+
+    def _close_pooled_channels(self):
+        while True:
+            try:
+                self._close_channel(self._channel_pool.get_nowait())
+            except Empty:
+                break
+
+    def _start_consumer_thread(self):
+        """
+        Starts the thread that consumes all subscriptions of a multiplexed connection,
+        unless it is already running.
+        """
+        with self._consumer_thread_lock:
+            if self._consumer_thread is not None and self._consumer_thread.is_alive():
+                return
+
+            self._consumer_thread = Thread(
+                target=self._consume_loopback_inbox
+                if self._is_loopback
+                else self._consume_multiplexed,
+                name="%s.consumer" % self.app_id,
+                daemon=True,
+            )
+            self._consumer_thread.start()
+
+    def _consume_loopback_inbox(self):
+        """
+        Delivers the messages of all loopback subscriptions of a multiplexed connection
+        """
+        while True:
+            tag, message = self._loopback_inbox.get()
+            if tag is None:
+                break
+            if message == "STOP":
+                self._loopback_callback_by_tag.pop(tag, None)
+                self._subscription_queue_by_tag.pop(tag, None)
+            elif tag in self._loopback_callback_by_tag:
+                self._loopback_callback_by_tag[tag](message)
+
+    def _consume_multiplexed(self):
+        """
+        Consumes all subscriptions of a multiplexed connection on a single channel and
+        runs the commands from `self._consumer_commands` in between.
+        """
+        try:
+            with self._connection.channel() as channel:
+                self._declare_exchange(channel)
+                self._consumer_channel = channel
+
+                while not channel.is_closed:
+                    self._run_consumer_commands(
+                        channel, block=not channel.consumer_tags
+                    )
+                    if channel.consumer_tags:
+                        # Handles all messages that have been received so far
+                        channel.process_data_events()
+        except AMQPConnectionError:
+            pass
+        except Exception:
+            LOG.exception("Error in consumer thread of connection %s:", self.app_id)
+        finally:
+            self._consumer_channel = None
+            self._subscription_queue_by_tag.clear()
+            # Fail commands that have not been run
+            while not self._consumer_commands.empty():
+                self._consumer_commands.get()[1].set_exception(
+                    AMQPConnectionError("The consumer thread has been stopped")
+                )
+
+    def _run_consumer_commands(self, channel: amqpstorm.Channel, block: bool):
+        """
+        Runs the commands from `self._consumer_commands` with `channel`. If `block` is
+        True, waits briefly for a command if there is none.
+        """
+        while True:
+            try:
+                command, result = self._consumer_commands.get(block=block, timeout=0.1)
+            except Empty:
+                return
+            block = False
+
+            if result.set_running_or_notify_cancel():
+                try:
+                    result.set_result(command(channel))
+                except Exception as e:
+                    result.set_exception(e)
+
+    def _run_on_consumer_thread(self, command: Callable[[amqpstorm.Channel], Any]):
+        """
+        Runs `command` with the consumer channel on the consumer thread of a multiplexed
+        connection, waits for it to finish, and returns its result.
+        """
+        if current_thread() is self._consumer_thread:
+            return command(self._consumer_channel)
+
+        self._start_consumer_thread()
+        result = Future()
+        self._consumer_commands.put((command, result))
+        return result.result()
+
     def setup_connection(self):
         """
         Deprecated: Use `connect()` instead.
@@ -278,11 +507,7 @@ class ManoBrokerConnection:
                 ),
             )
         else:
-            with self._connection.channel() as channel:  # Create a new channel
-                # Declare the exchange to be used
-                channel.exchange.declare(self.rabbitmq_exchange, exchange_type="topic")
-
-                # Publish the message
+            with self._pooled_channel() as channel:
                 channel.basic.publish(
                     body=body,
                     routing_key=topic,
@@ -305,18 +530,21 @@ class ManoBrokerConnection:
         topic: str,
         subscription_queue: str = None,
         concurrent=True,
+        executor: BoundedExecutor = None,
     ) -> str:
         """
         Subscribe to `topic` and invoke `cbf` for each received message. Starts a new
         thread that waits for messages and handles them. If `concurrent` is ``True``,
-        each callback function invocation will be executed in a separate thread.
-        Otherwise, the subscription thread will also execute the callback function, one
-        call after another.
+        each callback function invocation will be executed in a separate thread (or by
+        a worker of `executor`, if provided, or the connection's executor, if the
+        connection has been created with `max_workers`). Otherwise, the subscription
+        thread will also execute the callback function, one call after another.
 
         :param cbf: A callback function that will be invoked with every received message on the specified topic
         :param topic: The topic to subscribe to
         :param subscription_queue: A custom consumer tag for the subscription (will be auto-generated if omitted)
         :param concurrent: Whether or not to spawn a new thread for each callback invocation
+        :param executor: A `BoundedExecutor` to run the callback invocations of a concurrent subscription
         :return: The subscription's consumer tag
         """
 
@@ -325,14 +553,19 @@ class ManoBrokerConnection:
         if subscription_queue is None:
             subscription_queue = "%s.%s.%s" % ("q", topic, uuid4())
 
+        if concurrent and executor is None:
+            executor = self.executor
+
         def on_message_received(message: Message):
             # Call cbf of subscription
-            if concurrent:
+            if not concurrent:
+                cbf(message)
+            elif executor is not None:
+                executor.submit(cbf, message)
+            else:
                 Thread(
                     target=cbf, args=(message,), name=subscription_queue + ".callback"
                 ).start()
-            else:
-                cbf(message)
 
         def on_amqpstorm_message_received(amqpstormMessage: amqpstorm.Message):
             # Create custom message object and call cbf of subscription
@@ -341,6 +574,21 @@ class ManoBrokerConnection:
             # Acknowledge the message
             amqpstormMessage.ack()
 
+        prefetch_count = (
+            100 if not concurrent or executor is None else min(100, executor.capacity)
+        )
+
+        if self._is_multiplexed:
+            self._subscribe_multiplexed(
+                topic,
+                subscription_queue,
+                on_message_received,
+                on_amqpstorm_message_received,
+                prefetch_count,
+            )
+            LOG.debug("SUBSCRIBED to %s", topic)
+            return subscription_queue
+
         consumption_started_event = Event()
 
         def amqpstorm_subscriber():
@@ -348,10 +596,7 @@ class ManoBrokerConnection:
             A function that handles messages of the subscription.
             """
             with self._connection.channel() as channel:
-                # declare exchange for this channel
-                channel.exchange.declare(
-                    exchange=self.rabbitmq_exchange, exchange_type="topic"
-                )
+                self._declare_exchange(channel)
                 # create queue for subscription
                 queue = channel.queue
                 queue.declare(subscription_queue)
@@ -365,8 +610,9 @@ class ManoBrokerConnection:
                 # Store a reference to the queue (used for unsubscribing)
                 self._subscription_queue_by_tag[subscription_queue] = queue
 
-                # recommended qos setting
-                channel.basic.qos(100)
+                # recommended qos setting, limited to the executor's capacity (the
+                # subscription thread blocks while the executor is at capacity)
+                channel.basic.qos(prefetch_count)
                 # setup consumer (use queue name as tag)
                 channel.basic.consume(
                     on_amqpstorm_message_received,
@@ -419,6 +665,51 @@ class ManoBrokerConnection:
         LOG.debug("SUBSCRIBED to %s", topic)
         return subscription_queue
 
+    def _subscribe_multiplexed(
+        self,
+        topic: str,
+        subscription_queue: str,
+        on_message_received: Callable[[Message], None],
+        on_amqpstorm_message_received: Callable[[amqpstorm.Message], None],
+        prefetch_count: int,
+    ):
+        """
+        Sets up a subscription that is consumed by the connection's consumer thread
+        """
+        if self._is_loopback:
+            self._loopback_callback_by_tag[subscription_queue] = on_message_received
+            _get_loopback_queue(
+                topic,
+                subscription_queue,
+                _TaggedQueue(subscription_queue, self._loopback_inbox),
+            )
+            self._subscription_queue_by_tag[subscription_queue] = None
+            self._start_consumer_thread()
+            return
+
+        def declare_consumer(channel: amqpstorm.Channel):
+            if subscription_queue in channel.consumer_tags:
+                # Consumer tags have to be unique per channel
+                LOG.debug("Already consuming %s", subscription_queue)
+                return
+
+            channel.queue.declare(subscription_queue)
+            channel.queue.bind(
+                queue=subscription_queue,
+                routing_key=topic,
+                exchange=self.rabbitmq_exchange,
+            )
+            # The prefetch count applies to consumers that are created afterwards
+            channel.basic.qos(prefetch_count)
+            channel.basic.consume(
+                on_amqpstorm_message_received,
+                subscription_queue,
+                consumer_tag=subscription_queue,
+            )
+            self._subscription_queue_by_tag[subscription_queue] = channel.queue
+
+        self._run_on_consumer_thread(declare_consumer)
+
     def unsubscribe(self, subscription_queue):
         """
         Unsubscribe from `subscription_queue` if a subscription was made to it with
@@ -431,7 +722,18 @@ class ManoBrokerConnection:
             _delete_loopback_queue(subscription_queue)
         else:
             try:
-                self._subscription_queue_by_tag.pop(subscription_queue).delete()
+                queue = self._subscription_queue_by_tag.pop(subscription_queue)
+                if self._is_multiplexed:
+
+                    def delete_consumer(channel: amqpstorm.Channel):
+                        channel.basic.cancel(subscription_queue)
+                        channel.queue.delete(subscription_queue)
+
+                    self._run_on_consumer_thread(delete_consumer)
+                else:
+                    # Deletes the last queue that has been declared on the
+                    # subscription's channel
+                    queue.delete()
                 LOG.debug(
                     "unsubscribe(): Successfully deleted subscription queue %s.",
                     subscription_queue,
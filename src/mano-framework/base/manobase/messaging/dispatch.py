@@ -0,0 +1,109 @@
+"""
+Bounded thread pool dispatching of message callbacks
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+from time import monotonic
+from typing import Callable, Dict
+
+LOG = logging.getLogger(__name__)
+
+
+class DispatchStats:
+    """
+    Counters that describe the load of a `BoundedExecutor`
+    """
+
+    def __init__(self):
+        self.submitted = 0
+        self.completed = 0
+        self.queue_depth = 0  # Submitted callbacks that have not been started yet
+        self.max_queue_depth = 0
+        self.total_wait_time = 0.0  # Seconds between submission and start
+        self.max_wait_time = 0.0
+
+    @property
+    def mean_wait_time(self) -> float:
+        started = self.submitted - self.queue_depth
+        return self.total_wait_time / started if started > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "mean_wait_time": self.mean_wait_time,
+            "max_wait_time": self.max_wait_time,
+        }
+
+
+class BoundedExecutor:
+    """
+    Runs callbacks on a fixed number of worker threads. At most `capacity` callbacks
+    may be running or waiting at the same time; `submit()` blocks the calling thread
+    while the executor is at capacity. When called from a subscription's consumer
+    thread, this stops message acknowledgements, so the broker stops delivering once
+    the subscription's prefetch window is exhausted.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int = None, name="dispatch"):
+        """
+        :param max_workers: The number of worker threads
+        :param max_pending: The number of callbacks that may wait for a free worker
+        (defaults to `max_workers`)
+        :param name: A prefix for the worker thread names
+        """
+        if max_pending is None:
+            max_pending = max_workers
+
+        self.capacity = max_workers + max_pending
+        self.stats = DispatchStats()
+
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+        self._slots = BoundedSemaphore(self.capacity)
+        self._stats_lock = Lock()
+
+    def submit(self, callback: Callable, *args) -> None:
+        """
+        Schedules `callback(*args)` to be run by a worker thread, blocking while the
+        executor is at capacity. Exceptions raised by `callback` are logged.
+        """
+        self._slots.acquire()
+        submitted_at = monotonic()
+
+        with self._stats_lock:
+            self.stats.submitted += 1
+            self.stats.queue_depth += 1
+            self.stats.max_queue_depth = max(
+                self.stats.max_queue_depth, self.stats.queue_depth
+            )
+
+        def run():
+            wait_time = monotonic() - submitted_at
+            with self._stats_lock:
+                self.stats.queue_depth -= 1
+                self.stats.total_wait_time += wait_time
+                self.stats.max_wait_time = max(self.stats.max_wait_time, wait_time)
+
+            try:
+                callback(*args)
+            except Exception:
+                LOG.exception("Exception in dispatched callback %r", callback)
+            finally:
+                self._slots.release()
+                with self._stats_lock:
+                    self.stats.completed += 1
+
+        try:
+            self._executor.submit(run)
+        except RuntimeError:  # The executor has been shut down
+            self._slots.release()
+            with self._stats_lock:
+                self.stats.queue_depth -= 1
+            raise
+
+    def shutdown(self, wait=False):
+        self._executor.shutdown(wait=wait)
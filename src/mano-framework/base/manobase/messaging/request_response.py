@@ -271,13 +271,14 @@ class ManoBrokerRequestResponseConnection(ManoBrokerConnection):
         )
         return correlation_id
 
-    def register_async_endpoint(self, endpoint_handler, topic):
+    def register_async_endpoint(self, endpoint_handler, topic, executor=None):
         """
         Exposes the functionality implemented in `endpoint_handler` to callers that are
         connected to the broker.
 
         :param endpoint_handler: Function to be called when requests with the given topic and key are received
         :param topic: Topic for requests and responses
+        :param executor: An optional `BoundedExecutor` to run `endpoint_handler` with
         :return: The endpoint subscription's consumer tag
         """
         subscription_queue = self.subscribe(
@@ -288,6 +289,7 @@ class ManoBrokerRequestResponseConnection(ManoBrokerConnection):
                 self._on_request_endpoint_handler_finished,
             ),
             topic,
+            executor=executor,
         )
         LOG.debug(
             "Registered async endpoint: topic: %r handler: %r", topic, endpoint_handler
@@ -318,7 +320,9 @@ class ManoBrokerRequestResponseConnection(ManoBrokerConnection):
 
         self.publish(topic, payload, correlation_id=correlation_id, headers=headers)
 
-    def register_notification_endpoint(self, endpoint_handler, topic, key="default"):
+    def register_notification_endpoint(
+        self, endpoint_handler, topic, key="default", executor=None
+    ):
         """
         Registers `endpoint_handler` to be called when a notification on `topic` is
         received.
@@ -326,11 +330,14 @@ class ManoBrokerRequestResponseConnection(ManoBrokerConnection):
         :param endpoint_handler: Function to be called when requests with the given topic and key are received
         :param topic: Topic to subscribe the endpoint to
         :param key:  optional identifier for endpoints (enables more than 1 endpoint per topic)
+        :param executor: An optional `BoundedExecutor` to run `endpoint_handler` with
         :return: The endpoint subscription's consumer tag
         """
         # TODO (bjoluc) The key is not used here! Also, there's no unit test for keys.
         return self.subscribe(
-            functools.partial(self._on_notification_received, endpoint_handler), topic,
+            functools.partial(self._on_notification_received, endpoint_handler),
+            topic,
+            executor=executor,
         )
 
     def call_sync(
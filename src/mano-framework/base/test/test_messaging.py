@@ -30,7 +30,8 @@ import logging
 import traceback
 from itertools import product
 from queue import Empty, Queue
-from time import time
+from threading import Lock, active_count
+from time import sleep, time
 from typing import List
 
 import pytest
@@ -198,6 +199,18 @@ def test_multi_publish(connection, receiver):
     assert [str(i) for i in range(5)] == receiver.wait_for_messages(0, 5)
 
 
+@pytest.mark.parametrize(
+    "connection", [(ManoBrokerConnection, False)], indirect=["connection"]
+)
+def test_publish_channel_reuse(connection: ManoBrokerConnection):
+    """
+    Ensure that consecutive publish calls reuse a pooled channel
+    """
+    for i in range(5):
+        connection.publish("test.pool", str(i))
+    assert 1 == connection._channel_pool.qsize()
+
+
 @connection_classes(ManoBrokerConnection)
 def test_doulbe_subscription(connection, receiver):
     """
@@ -213,6 +226,80 @@ def test_doulbe_subscription(connection, receiver):
         assert [str(i) for i in range(5)] == receiver.wait_for_messages(queue, 5)
 
 
+@pytest.mark.parametrize("is_loopback", [False, True])
+def test_bounded_executor(is_loopback):
+    """
+    Ensure that a connection with `max_workers` runs at most `max_workers` callbacks
+    at a time and records dispatch statistics
+    """
+    connection = ManoBrokerConnection(
+        "test-bounded-executor", is_loopback=is_loopback, max_workers=2
+    )
+    lock = Lock()
+    running = 0
+    max_running = 0
+    received = Queue()
+
+    def cbf(message: Message):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(running, max_running)
+        sleep(0.01)
+        with lock:
+            running -= 1
+        received.put(message.payload)
+
+    try:
+        connection.subscribe(cbf, "test.bounded")
+        for i in range(10):
+            connection.publish("test.bounded", i)
+
+        assert set(range(10)) == {received.get(timeout=5) for _ in range(10)}
+        assert max_running <= 2
+
+        stats = connection.executor.stats
+        assert 10 == stats.submitted
+        assert 0 == stats.queue_depth
+        assert 0 < stats.max_queue_depth <= connection.executor.capacity
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("is_loopback", [False, True])
+def test_multiplexed_subscriptions(is_loopback, receiver):
+    """
+    Ensure that a multiplexed connection consumes all subscriptions with a single
+    thread and routes messages to the right subscriptions
+    """
+    connection = ManoBrokerRequestResponseConnection(
+        "test-multiplex", is_loopback=is_loopback, multiplex=True
+    )
+    try:
+        threads_before = active_count()
+        tag = connection.subscribe(receiver.create_cbf(0), "test.multiplex1")
+        connection.subscribe(receiver.create_cbf(1), "test.multiplex2")
+        connection.register_async_endpoint(receiver.echo_cbf, "test.multiplex.echo")
+        assert threads_before + 1 == active_count()
+
+        connection.publish("test.multiplex1", "m1")
+        connection.publish("test.multiplex2", "m2")
+        assert ["m1"] == receiver.wait_for_messages(0)
+        assert ["m2"] == receiver.wait_for_messages(1)
+
+        response = connection.call_sync("test.multiplex.echo", "ping", timeout=5)
+        assert "ping" == response.payload
+
+        connection.unsubscribe(tag)
+        connection.publish("test.multiplex1", "m3")
+        connection.publish("test.multiplex2", "m4")
+        assert ["m4"] == receiver.wait_for_messages(1)
+        with pytest.raises(Exception):
+            receiver.wait_for_messages(0, timeout=0.2)
+    finally:
+        connection.close()
+
+
 # Test ManoBrokerRequestResponseConnection functions (which AsyncioBrokerConnection
 # should support as well)
 @connection_classes(ManoBrokerRequestResponseConnection, AsyncioBrokerConnection)